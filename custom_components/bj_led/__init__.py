@@ -4,7 +4,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, Event
 from homeassistant.const import CONF_MAC, EVENT_HOMEASSISTANT_STOP
 
-from .const import DOMAIN, CONF_RESET, CONF_DELAY
+from .const import DOMAIN, CONF_RESET, CONF_DELAY, CONF_JOURNAL, CONF_HOT, JOURNAL_MAX_SIZE
 from .bjled import BJLEDInstance
 import logging
 
@@ -15,9 +15,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up from a config entry."""
     reset = entry.options.get(CONF_RESET, None) or entry.data.get(CONF_RESET, None)
     delay = entry.options.get(CONF_DELAY, None) or entry.data.get(CONF_DELAY, None)
+    journal = min(entry.options.get(CONF_JOURNAL, 0), JOURNAL_MAX_SIZE)
+    hot = entry.options.get(CONF_HOT, False)
     LOGGER.debug("Config Reset data: %s and config delay data: %s", reset, delay)
 
-    instance = BJLEDInstance(entry.data[CONF_MAC], reset, delay, hass)
+    instance = BJLEDInstance(entry.data[CONF_MAC], reset, delay, hass, journal, hot)
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = instance
 
@@ -45,5 +47,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
     instance = hass.data[DOMAIN][entry.entry_id]
-    if entry.title != instance.name:
+    if (
+        entry.title != instance.name
+        or min(entry.options.get(CONF_JOURNAL, 0), JOURNAL_MAX_SIZE) != instance.journal_size
+        or entry.options.get(CONF_HOT, False) != instance.hot
+    ):
         await hass.config_entries.async_reload(entry.entry_id)
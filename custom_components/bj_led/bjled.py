@@ -4,7 +4,7 @@ from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.components.light import (ColorMode)
 from bleak.backends.device import BLEDevice
 from bleak.backends.service import BleakGATTCharacteristic, BleakGATTServiceCollection
-from bleak.exc import BleakDBusError
+from bleak.exc import BleakDBusError, BleakError
 from bleak_retry_connector import BLEAK_RETRY_EXCEPTIONS as BLEAK_EXCEPTIONS
 from bleak_retry_connector import (
     BleakClientWithServiceCache,
@@ -14,10 +14,14 @@ from bleak_retry_connector import (
     establish_connection,
 )
 from typing import Any, TypeVar, cast, Tuple
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 #import traceback
 import logging
 import colorsys
+import time
+
+from .journal import CommandJournal, RESULT_CANCELLED, RESULT_ERROR, RESULT_OK
+from .models import BJLEDModel, DEFAULT_MODEL, lookup_model
 
 
 LOGGER = logging.getLogger(__name__)
@@ -72,14 +76,31 @@ EFFECT_MAP = {
 }
 
 EFFECT_LIST = sorted(EFFECT_MAP)
+EFFECT_SPEED = 0x03 # Between 0 and 10
 EFFECT_ID_NAME = {v: k for k, v in EFFECT_MAP.items()}
 
-NAME_ARRAY = ["BJ_LED"]
-WRITE_CHARACTERISTIC_UUIDS = ["0000ee01-0000-1000-8000-00805f9b34fb"]
-TURN_ON_CMD  = [bytearray.fromhex("69 96 02 01 01")]
-TURN_OFF_CMD = [bytearray.fromhex("69 96 02 01 00")]
+# Hardware strobes we can use for flashing, keyed by their colour at full saturation
+STROBE_COLORS = {
+    (255, 0, 0):     EFFECT_0x03_0x0d,
+    (0, 255, 0):     EFFECT_0x03_0x0e,
+    (0, 0, 255):     EFFECT_0x03_0x0f,
+    (255, 255, 0):   EFFECT_0x03_0x10,
+    (0, 255, 255):   EFFECT_0x03_0x11,
+    (255, 0, 255):   EFFECT_0x03_0x12,
+    (255, 255, 255): EFFECT_0x03_0x13,
+}
+FLASH_SHORT_DURATION = 1.0
+FLASH_LONG_DURATION = 10.0
+FLASH_PERIOD = 0.5 # On and off time of one flash when we have to do it ourselves
+
 DEFAULT_ATTEMPTS = 3
+RECONNECT_BACKOFF = (1, 2, 5, 10, 30, 60) # Seconds between background reconnect attempts, the last repeats
 BLEAK_BACKOFF_TIME = 0.25
+PIPELINE_DEPTH = 4 # Max write-without-response frames in flight on one connection
+LATENCY_SMOOTHING = 0.2 # Weight of the newest sample in the write latency average
+MIN_FRAME_INTERVAL = 0.02 # Transition frame rate ceiling, 50 fps
+MAX_FRAME_INTERVAL = 0.25 # Slowest we'll step a transition, however slow the device
+DEFAULT_FRAME_INTERVAL = 0.05 # Used until we've measured the device's write latency
 RETRY_BACKOFF_EXCEPTIONS = (BleakDBusError)
 
 WrapFuncType = TypeVar("WrapFuncType", bound=Callable[..., Any])
@@ -149,7 +170,7 @@ def retry_bluetooth_connection_error(func: WrapFuncType) -> WrapFuncType:
 
 
 class BJLEDInstance:
-    def __init__(self, address, reset: bool, delay: int, hass) -> None:
+    def __init__(self, address, reset: bool, delay: int, hass, journal_size: int = 0, hot: bool = False) -> None:
         self.loop = asyncio.get_running_loop()
         self._mac = address
         self._reset = reset
@@ -171,37 +192,214 @@ class BJLEDInstance:
         self._brightness = 255
         self._effect = None
         self._effect_speed = 0x64
-        self._color_mode = ColorMode.RGB
         self._write_uuid = None
-        self._turn_on_cmd = None
-        self._turn_off_cmd = None
+        self._pipeline_depth = 1
+        self._in_flight: set[asyncio.Task] = set()
+        self._pipeline_error: BaseException | None = None
+        self._write_latency: float | None = None
+        self._stream_task: asyncio.Task | None = None
+        self._stale_output = False
+        self._output_color: Tuple[int, ...] | None = None # Last colour frame sent, None when unknown or an effect is running
+        self._journal = CommandJournal(journal_size) if journal_size else None
+        self._hot = hot
+        self._reconnect_task: asyncio.Task | None = None
+        self._stopping = False
         self._model = self._detect_model()
-        
+        self._turn_on_cmd = bytearray(self._model.turn_on)
+        self._turn_off_cmd = bytearray(self._model.turn_off)
+        self._color_mode = ColorMode.RGBW if self._model.rgbw else ColorMode.RGB
+        self._black = (0,) * (4 if self._model.rgbw else 3)
+        self._effect_list = [
+            effect for effect in EFFECT_LIST if EFFECT_MAP[effect][0] in self._model.effect_banks
+        ]
+
         LOGGER.debug(
-            "Model information for device %s : ModelNo %s. MAC: %s",
+            "Model information for device %s : Model %s. MAC: %s",
             self._device.name,
-            self._model,
+            self._model.name,
             self._mac,
         )
 
-    def _detect_model(self):
-        x = 0
-        for name in NAME_ARRAY:
-            if self._device.name.lower().startswith(name.lower()):
-                self._turn_on_cmd = TURN_ON_CMD[x]
-                self._turn_off_cmd = TURN_OFF_CMD[x]
-                return x
-            x = x + 1
+    def _detect_model(self) -> BJLEDModel:
+        model = lookup_model(self._device.name)
+        if model is None:
+            LOGGER.warning(
+                "%s: Unknown model, falling back to %s frames", self._device.name, DEFAULT_MODEL.name
+            )
+            model = DEFAULT_MODEL
+        return model
 
     async def _write(self, data: bytearray):
         """Send command to device and read response."""
+        await self._cancel_stream()
         await self._ensure_connected()
         await self._write_while_connected(data)
 
     async def _write_while_connected(self, data: bytearray):
-        LOGGER.debug(f"Writing data to {self.name}: {data.hex()}")
-        await self._client.write_gatt_char(self._write_uuid, data, False)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Writing data to %s: %s", self.name, data.hex())
+        await self._timed_write(data)
+
+    async def _timed_write(self, data: bytearray):
+        """Write a single frame and fold its round trip into the latency average."""
+        if self._client is None:
+            # Disconnected underneath a background stream
+            raise BleakError(f"{self.name}: Not connected")
+        start = self.loop.time()
+        result = RESULT_ERROR
+        try:
+            await self._client.write_gatt_char(self._write_uuid, data, False)
+            result = RESULT_OK
+        except asyncio.CancelledError:
+            result = RESULT_CANCELLED
+            raise
+        finally:
+            latency = self.loop.time() - start
+            if self._journal is not None:
+                self._journal.append(
+                    time.time() - latency, data, result, latency, getattr(self._write_uuid, "handle", 0)
+                )
+        if self._write_latency is None:
+            self._write_latency = latency
+        else:
+            self._write_latency += LATENCY_SMOOTHING * (latency - self._write_latency)
+
+    @retry_bluetooth_connection_error
+    async def _write_pipelined(self, frames: Sequence[bytearray]):
+        """Stream frames over one connection, keeping up to _pipeline_depth in flight.
+
+        The connection is checked once for the whole batch rather than once per frame.
+        When the characteristic can't take write-without-response the depth is 1 and
+        this degrades to plain serial writes.  frames is a sequence rather than any
+        iterable because a retry goes through it again from the start.
+        """
+        await self._ensure_connected()
+        start = self.loop.time()
+        count = 0
+        try:
+            for frame in frames:
+                await self._submit_frame(frame)
+                count += 1
+        except BaseException:
+            # Let the frames already on their way settle before the retry starts over
+            await self._discard_pipeline()
+            raise
+        await self._flush_pipeline()
+        elapsed = self.loop.time() - start
+        if count and elapsed > 0:
+            LOGGER.debug(
+                "%s: Wrote %s frames in %.3fs (%.1f fps, depth %s)",
+                self.name,
+                count,
+                elapsed,
+                count / elapsed,
+                self._pipeline_depth,
+            )
+
+    async def _submit_frame(self, data: bytearray):
+        """Queue a frame, only waiting when the pipeline is full."""
+        while len(self._in_flight) >= self._pipeline_depth:
+            await asyncio.wait(self._in_flight, return_when=asyncio.FIRST_COMPLETED)
+        self._raise_pipeline_error()
+        task = self.loop.create_task(self._write_while_connected(data))
+        self._in_flight.add(task)
+        task.add_done_callback(self._frame_done)
+
+    def _frame_done(self, task: asyncio.Task) -> None:
+        self._in_flight.discard(task)
+        if not task.cancelled() and task.exception() and self._pipeline_error is None:
+            self._pipeline_error = task.exception()
+
+    async def _drain_pipeline(self):
+        if self._in_flight:
+            await asyncio.wait(self._in_flight)
+
+    async def _flush_pipeline(self):
+        """Wait for every in-flight frame and surface the first write error."""
+        await self._drain_pipeline()
+        self._raise_pipeline_error()
+
+    async def _discard_pipeline(self):
+        """Wait for every in-flight frame and forget any errors they raise.
+
+        After the first error the frames behind it can still fail, and their error
+        must not abort whatever is written next.
+        """
+        await self._drain_pipeline()
+        self._pipeline_error = None
+
+    def _raise_pipeline_error(self) -> None:
+        if self._pipeline_error is not None:
+            err, self._pipeline_error = self._pipeline_error, None
+            raise err
+
+    async def _cancel_stream(self) -> None:
+        """Stop any running transition so a new command doesn't queue behind it."""
+        task, self._stream_task = self._stream_task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        await asyncio.wait([task])
+        # Left part way through, so the strip isn't showing our state
+        self._stale_output = True
+        # Frames it already handed off must land before the new command does
+        await self._discard_pipeline()
+
+    def _frame_interval(self) -> float:
+        """Pick a transition frame interval the device can keep up with."""
+        if self._write_latency is None:
+            return DEFAULT_FRAME_INTERVAL
+        interval = self._write_latency / self._pipeline_depth
+        return min(max(interval, MIN_FRAME_INTERVAL), MAX_FRAME_INTERVAL)
+
+    def _resolve_pipeline_depth(self, client: BleakClientWithServiceCache) -> int:
+        """Work out how many frames can safely be in flight on this connection.
+
+        This is the fixed PIPELINE_DEPTH, not flow control derived from the MTU.
+        Bleak doesn't expose LE credits, so a small constant stands in for them.
+        The size check only drops to serial writes for a frame that wouldn't fit
+        in one write, which can't happen at the minimum 20 byte ATT payload with
+        today's frames of at most 9 bytes.
+        """
+        char = self._write_uuid
+        if not isinstance(char, BleakGATTCharacteristic):
+            return 1
+        if "write-without-response" not in char.properties:
+            # Writes with response are acknowledged one at a time
+            return 1
+        max_size = getattr(char, "max_write_without_response_size", None)
+        if max_size is None:
+            # Only read the MTU when we must, BlueZ warns when it falls back to the default
+            max_size = client.mtu_size - 3
+        if max_size < self._model.max_frame_size:
+            return 1
+        return PIPELINE_DEPTH
     
+    @property
+    def journal(self) -> CommandJournal | None:
+        return self._journal
+
+    @property
+    def journal_size(self) -> int:
+        return self._journal.size if self._journal else 0
+
+    @property
+    def needs_refresh(self) -> bool:
+        """True while a fade or flash runs, or when the strip was left showing something else."""
+        return self._stale_output or (self._stream_task is not None and not self._stream_task.done())
+
+    @property
+    def hot(self) -> bool:
+        return self._hot
+
+    @property
+    def write_latency(self) -> float | None:
+        return self._write_latency
+
+    @property
+    def pipeline_depth(self) -> int:
+        return self._pipeline_depth
+
     @property
     def mac(self):
         return self._device.address
@@ -232,7 +430,7 @@ class BJLEDInstance:
 
     @property
     def effect_list(self) -> list[str]:
-        return EFFECT_LIST
+        return self._effect_list
 
     @property
     def effect(self):
@@ -242,60 +440,240 @@ class BJLEDInstance:
     def color_mode(self):
         return self._color_mode
 
+    @property
+    def model(self) -> BJLEDModel:
+        return self._model
+
     @retry_bluetooth_connection_error
-    async def set_rgb_color(self, rgb: Tuple[int, int, int], brightness: int | None = None):
+    async def set_rgb_color(self, rgb: Tuple[int, ...], brightness: int | None = None):
         self._rgb_color = rgb
+        self._effect = None
         if brightness is None:
             if self._brightness is None:
                 self._brightness = 255
-            else:
-                brightness = self._brightness
+            brightness = self._brightness
+        else:
+            self._brightness = brightness
+        color = self._scale_color(rgb, brightness)
+        await self._write(self._color_packet(color))
+        self._output_color = color
+        self._stale_output = False
+
+    def _scale_color(self, color: Tuple[int, ...], brightness: int) -> Tuple[int, ...]:
+        """Scale an RGB or RGBW colour by brightness, giving one value per model channel."""
         brightness_percent = int(brightness * 100 / 255)
-        # Now adjust the RBG values to match the brightness
-        red = int(rgb[0] * brightness_percent / 100)
-        green = int(rgb[1] * brightness_percent / 100)
-        blue = int(rgb[2] * brightness_percent / 100)
-        # RGB packet
-        rgb_packet = bytearray.fromhex("69 96 05 02")
-        rgb_packet.append(red)
-        rgb_packet.append(green)
-        rgb_packet.append(blue)
-        await self._write(rgb_packet)
+        # Now adjust the colour values to match the brightness
+        scaled = tuple(int(channel * brightness_percent / 100) for channel in color)
+        return (scaled + self._black)[:len(self._black)]
 
-    async def set_brightness_local(self, value: int):
-        # 0 - 255, should convert automatically with the hex calls
-        # call color temp or rgb functions to update
-        self._brightness = value
-        await self.set_rgb_color(self._rgb_color, value)
+    def _color_packet(self, color: Tuple[int, ...]) -> bytearray:
+        return self._model.color_frame(color)
 
     @retry_bluetooth_connection_error
-    async def turn_on(self):
-        await self._write(self._turn_on_cmd)
+    async def transition_to(self, rgb: Tuple[int, ...], brightness: int, duration: float):
+        """Fade from what the strip is showing now to rgb at brightness over duration seconds.
+
+        The fade runs in the background; any other command cancels it straight away.
+        """
+        end = self._scale_color(rgb, brightness)
+        if not self._is_on:
+            start = self._black
+        elif self._output_color is not None:
+            # Start from what was last sent, which mid-fade isn't the previous target
+            start = self._output_color
+        elif self._rgb_color is not None:
+            # An effect is running, fade from the colour it replaced rather than dropping to black
+            start = self._scale_color(self._rgb_color, self._brightness)
+        else:
+            # Nothing known to fade from, so go straight to the target
+            start = end
+        if not self._is_on:
+            # Go dark first so turning on doesn't flash the old colour
+            await self._write(self._color_packet(start))
+            await self._write(self._turn_on_cmd)
+        else:
+            await self._cancel_stream()
         self._is_on = True
-                
+        self._stale_output = False
+        self._rgb_color = rgb
+        self._brightness = brightness
+        self._effect = None
+        self._stream_task = self.loop.create_task(self._run_transition(start, end, duration))
+
     @retry_bluetooth_connection_error
-    async def turn_off(self):
-        await self._write(self._turn_off_cmd)
+    async def fade_off(self, duration: float):
+        """Fade to black over duration seconds and then switch off."""
+        if not self._is_on or self._output_color is None:
+            await self.turn_off()
+            return
+        await self._cancel_stream()
         self._is_on = False
+        self._stale_output = True
+        start = self._output_color
+        self._stream_task = self.loop.create_task(
+            self._run_transition(start, self._black, duration, self._turn_off_cmd)
+        )
+
+    async def _run_transition(
+        self,
+        start: Tuple[int, ...],
+        end: Tuple[int, ...],
+        duration: float,
+        final: bytearray | None = None,
+    ):
+        """Stream interpolated colour frames, finishing on time.
+
+        Each frame is computed from the clock when it is sent, so if the device is
+        slow we simply send fewer frames rather than running late.  The end colour
+        is always sent last.
+        """
+        try:
+            await self._ensure_connected()
+            begin = self.loop.time()
+            deadline = begin + duration
+            sent = 0
+            while (now := self.loop.time()) < deadline:
+                progress = (now - begin) / duration
+                frame = tuple(int(a + (b - a) * progress) for a, b in zip(start, end))
+                await self._submit_frame(self._color_packet(frame))
+                self._output_color = frame
+                sent += 1
+                await asyncio.sleep(min(self._frame_interval(), max(deadline - self.loop.time(), 0)))
+            await self._submit_frame(self._color_packet(end))
+            self._output_color = end
+            if final is not None:
+                await self._submit_frame(final)
+            await self._flush_pipeline()
+            LOGGER.debug(
+                "%s: Transition of %.2fs finished with %s frames, %.2fs late",
+                self.name,
+                duration,
+                sent + 1,
+                self.loop.time() - deadline,
+            )
+        except BLEAK_EXCEPTIONS as err:
+            LOGGER.warning("%s: Transition aborted: %s", self.name, err)
+            # Left somewhere between start and end, make turn_on put the target back
+            self._stale_output = True
+            await self._discard_pipeline()
+
+    async def set_brightness_local(self, value: int):
+        # 0 - 255, should convert automatically with the hex calls
+        # call color temp or rgb functions to update
+        self._brightness = value
+        # Nothing to scale until a colour has been set, so start from white
+        await self.set_rgb_color(self._rgb_color or (255, 255, 255), value)
 
     @retry_bluetooth_connection_error
     async def set_effect(self, effect: str):
-        if effect not in EFFECT_LIST:
+        if effect not in self._effect_list:
             LOGGER.error("Effect %s not supported", effect)
             return
         self._effect = effect
-        effect_packet = bytearray.fromhex("69 96 03")
+        await self._write(self._effect_packet(effect))
+        self._output_color = None
+        self._stale_output = False
+
+    def _effect_packet(self, effect: str) -> bytearray:
         effect_id = EFFECT_MAP.get(effect)
         LOGGER.debug('Effect ID: %s', effect_id)
         LOGGER.debug('Effect name: %s', effect)
-        effect_packet.append(effect_id[0])
-        effect_packet.append(effect_id[1])
-        effect_packet.append(0x03) # Between 0 and 10
-        await self._write(effect_packet)
+        return self._model.effect_frame(effect_id, EFFECT_SPEED)
+
+    def _state_color(self) -> Tuple[int, ...] | None:
+        """The colour our state says the strip shows, None for effects or when unknown."""
+        if self._effect is None and self._rgb_color is not None:
+            return self._scale_color(self._rgb_color, self._brightness)
+        return None
+
+    def _state_packet(self) -> bytearray | None:
+        """The single frame that puts back the current effect or colour, if we know it."""
+        if self._effect is not None:
+            return self._effect_packet(self._effect)
+        if (color := self._state_color()) is not None:
+            return self._color_packet(color)
+        return None
+
+    def _strobe_for(self, rgb: Tuple[int, ...]) -> str | None:
+        """Find the hardware strobe matching rgb, ignoring brightness and white."""
+        peak = max(rgb[:3])
+        if not peak:
+            return None
+        snapped = []
+        for channel in rgb[:3]:
+            ratio = channel / peak
+            if ratio >= 0.9:
+                snapped.append(255)
+            elif ratio <= 0.1:
+                snapped.append(0)
+            else:
+                return None
+        strobe = STROBE_COLORS.get(tuple(snapped))
+        return strobe if strobe in self._effect_list else None
+
+    @retry_bluetooth_connection_error
+    async def flash(self, rgb: Tuple[int, ...], brightness: int, duration: float):
+        """Flash rgb for duration seconds, then put the previous state back.
+
+        Uses the strip's own strobe effect when one matches the colour, so only a
+        couple of frames are sent.  Otherwise the flashing is timed from here.
+        The light's state isn't changed and any other command cancels the flash.
+        """
+        was_on = self._is_on
+        strobe = self._strobe_for(rgb)
+        if strobe is not None:
+            LOGGER.debug("%s: Flashing with %s", self.name, strobe)
+            frames = []
+            first = self._effect_packet(strobe)
+        else:
+            frames = [self._color_packet(self._scale_color(rgb, brightness)), self._color_packet(self._black)]
+            first = frames[0]
+        # Load the flash before switching on so the old colour doesn't show
+        await self._write(first)
+        if not was_on:
+            await self._write(self._turn_on_cmd)
+        # One frame is enough to restore the effect or colour, or to switch back off
+        if was_on:
+            packet = self._state_packet()
+            # With nothing known to put back, leave it for the next turn_on to refresh
+            restore = [packet] if packet is not None else []
+            stale = packet is None
+        else:
+            restore = [self._turn_off_cmd]
+            stale = True
+        self._stale_output = True
+        self._output_color = None
+        self._stream_task = self.loop.create_task(self._run_flash(frames, duration, restore, stale))
+
+    async def _run_flash(self, frames: list[bytearray], duration: float, restore: list[bytearray], stale: bool):
+        try:
+            await self._ensure_connected()
+            deadline = self.loop.time() + duration
+            step = 1 # flash() already sent the first frame
+            while (remaining := deadline - self.loop.time()) > 0:
+                await asyncio.sleep(min(FLASH_PERIOD / 2, remaining) if frames else remaining)
+                if frames and self.loop.time() < deadline:
+                    await self._submit_frame(frames[step % len(frames)])
+                    step += 1
+            for frame in restore:
+                await self._submit_frame(frame)
+            await self._flush_pipeline()
+            # Switched back off with the flash loaded, or had nothing to put back, so turn_on must restore
+            self._stale_output = stale
+            if not stale:
+                self._output_color = self._state_color()
+        except BLEAK_EXCEPTIONS as err:
+            LOGGER.warning("%s: Flash aborted: %s", self.name, err)
+            await self._discard_pipeline()
 
     @retry_bluetooth_connection_error
     async def turn_on(self):
         await self._write(self._turn_on_cmd)
+        if self._stale_output and (packet := self._state_packet()) is not None:
+            # The strip was left showing a fade or flash, put our state back
+            await self._write(packet)
+            self._output_color = self._state_color()
+        self._stale_output = False
         self._is_on = True
 
     @retry_bluetooth_connection_error
@@ -341,11 +719,12 @@ class BJLEDInstance:
             self._cached_services = client.services if resolved else None
 
             self._client = client
+            self._pipeline_depth = self._resolve_pipeline_depth(client)
             self._reset_disconnect_timer()
 
     def _resolve_characteristics(self, services: BleakGATTServiceCollection) -> bool:
         """Resolve characteristics."""
-        for characteristic in WRITE_CHARACTERISTIC_UUIDS:
+        for characteristic in self._model.write_uuids:
             if char := services.get_characteristic(characteristic):
                 self._write_uuid = char
                 break
@@ -356,6 +735,9 @@ class BJLEDInstance:
         if self._disconnect_timer:
             self._disconnect_timer.cancel()
         self._expected_disconnect = False
+        if self._hot:
+            # Hot devices stay connected, the reconnect path depends on it
+            return
         if self._delay is not None and self._delay != 0:
             LOGGER.debug(
                 "%s: Configured disconnect from device in %s seconds",
@@ -370,15 +752,84 @@ class BJLEDInstance:
             LOGGER.debug("%s: Disconnected from device", self.name)
             return
         LOGGER.warning("%s: Device unexpectedly disconnected", self.name)
+        if self._hot and not self._stopping and (self._reconnect_task is None or self._reconnect_task.done()):
+            if self._disconnect_timer:
+                # Otherwise it fires during a long outage and looks like a deliberate disconnect
+                self._disconnect_timer.cancel()
+                self._disconnect_timer = None
+            self._reconnect_task = self.loop.create_task(self._reconnect())
+
+    def _has_free_slot(self) -> bool:
+        """Check an adapter that can hear the device has a connection slot to spare."""
+        service_info = bluetooth.async_last_service_info(self._hass, self._mac, connectable=True)
+        if service_info is None:
+            # Nothing connectable can hear it, probably still browned out
+            return False
+        current_allocations = getattr(bluetooth, "async_current_allocations", None)
+        if current_allocations is None:
+            # Older Home Assistant without slot tracking, just try
+            return True
+        allocations = current_allocations(self._hass, service_info.source)
+        return not allocations or any(allocation.free for allocation in allocations)
+
+    async def _reconnect(self) -> None:
+        """Keep trying to get a hot device back, then restore its state."""
+        attempt = 0
+        while True:
+            await asyncio.sleep(RECONNECT_BACKOFF[min(attempt, len(RECONNECT_BACKOFF) - 1)])
+            attempt += 1
+            if self._stopping:
+                LOGGER.debug("%s: Stopped, giving up reconnecting", self.name)
+                return
+            if self._client and self._client.is_connected:
+                LOGGER.debug("%s: Already reconnected by a command", self.name)
+                return
+            if not self._has_free_slot():
+                LOGGER.debug("%s: No adapter with a free slot can reach the device yet", self.name)
+                continue
+            if device := bluetooth.async_ble_device_from_address(self._hass, self._mac, connectable=True):
+                self._device = device
+            try:
+                await self._ensure_connected()
+                await self._restore_state()
+            except BLEAK_EXCEPTIONS as err:
+                LOGGER.debug("%s: Reconnect attempt %s failed: %s", self.name, attempt, err)
+                continue
+            LOGGER.info("%s: Reconnected after %s attempts", self.name, attempt)
+            return
+
+    async def _restore_state(self) -> None:
+        """Re-send the last power, colour and effect state in one burst."""
+        if self._is_on is None:
+            return
+        await self._cancel_stream()
+        if not self._is_on:
+            frames = [self._turn_off_cmd]
+        else:
+            frames = [self._turn_on_cmd]
+            if (packet := self._state_packet()) is not None:
+                frames.append(packet)
+        await self._write_pipelined(frames)
+        self._stale_output = False
+        self._output_color = self._state_color() if self._is_on else None
 
     def _disconnect(self) -> None:
         """Disconnect from device."""
         self._disconnect_timer = None
+        if self._stream_task is not None and not self._stream_task.done():
+            # Don't pull the connection out from under a fade or flash
+            self._reset_disconnect_timer()
+            return
         asyncio.create_task(self._execute_timed_disconnect())
 
     async def stop(self) -> None:
         """Stop the LEDBLE."""
         LOGGER.debug("%s: Stop", self.name)
+        self._stopping = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        await self._cancel_stream()
         await self._execute_disconnect()
 
     async def _execute_timed_disconnect(self) -> None:
@@ -397,6 +848,7 @@ class BJLEDInstance:
             self._expected_disconnect = True
             self._client = None
             self._write_uuid = None
+            self._pipeline_depth = 1
             if client and client.is_connected:
                 await client.disconnect()
             LOGGER.debug("%s: Disconnected", self.name)
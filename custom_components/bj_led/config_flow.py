@@ -1,5 +1,6 @@
 import asyncio
 from .bjled import BJLEDInstance
+from .models import lookup_model
 from typing import Any
 
 from bluetooth_data_tools import human_readable_name
@@ -16,7 +17,7 @@ from homeassistant.components.bluetooth import (
 from bluetooth_sensor_state_data import BluetoothData
 from home_assistant_bluetooth import BluetoothServiceInfo
 
-from .const import DOMAIN, CONF_RESET, CONF_DELAY
+from .const import DOMAIN, CONF_RESET, CONF_DELAY, CONF_JOURNAL, CONF_HOT, JOURNAL_MAX_SIZE
 import logging
 
 LOGGER = logging.getLogger(__name__)
@@ -28,7 +29,7 @@ class DeviceData(BluetoothData):
         #LOGGER.debug("Discovered bluetooth devices, DeviceData, : %s , %s", self._discovery.address, self._discovery.name)
 
     def supported(self):
-        return self._discovery.name.lower().startswith("bj_led")
+        return lookup_model(self._discovery.name) is not None
 
     def address(self):
         return self._discovery.address
@@ -209,13 +210,20 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         errors = {}
         options = self.config_entry.options or {CONF_RESET: False,CONF_DELAY: 120}
         if user_input is not None:
-            return self.async_create_entry(title="", data={CONF_RESET: user_input[CONF_RESET], CONF_DELAY: user_input[CONF_DELAY]})
+            return self.async_create_entry(title="", data={
+                CONF_RESET: user_input.get(CONF_RESET, options.get(CONF_RESET, False)),
+                CONF_DELAY: user_input[CONF_DELAY],
+                CONF_JOURNAL: user_input[CONF_JOURNAL],
+                CONF_HOT: user_input[CONF_HOT],
+            })
 
         return self.async_show_form(
             step_id="user",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(CONF_DELAY, default=options.get(CONF_DELAY)): int
+                    vol.Optional(CONF_DELAY, default=options.get(CONF_DELAY)): int,
+                    vol.Optional(CONF_JOURNAL, default=options.get(CONF_JOURNAL, 0)): vol.All(int, vol.Range(min=0, max=JOURNAL_MAX_SIZE)),
+                    vol.Optional(CONF_HOT, default=options.get(CONF_HOT, False)): bool
                 }
             ), errors=errors
         )
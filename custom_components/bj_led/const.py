@@ -3,3 +3,6 @@ from enum import Enum
 DOMAIN = "bj_led"
 CONF_RESET = "reset"
 CONF_DELAY = "delay"
+CONF_JOURNAL = "journal"
+JOURNAL_MAX_SIZE = 10000 # 32 bytes a record, so about 320 KB
+CONF_HOT = "hot"
@@ -0,0 +1,43 @@
+"""Diagnostics support for BJ_LED."""
+from __future__ import annotations
+
+import base64
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .bjled import BJLEDInstance
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry, including the command journal if enabled."""
+    instance: BJLEDInstance = hass.data[DOMAIN][entry.entry_id]
+    data: dict[str, Any] = {
+        "name": instance.name,
+        "is_on": instance.is_on,
+        "rgb_color": instance.rgb_color,
+        "brightness": instance.brightness,
+        "effect": instance.effect,
+        "write_latency": instance.write_latency,
+        "pipeline_depth": instance.pipeline_depth,
+    }
+    journal = instance.journal
+    if journal is not None:
+        data["journal"] = {
+            "entries": [
+                {
+                    "timestamp": record.timestamp,
+                    "frame": record.frame.hex(),
+                    "result": record.result,
+                    "latency": record.latency,
+                }
+                for record in journal.entries()
+            ],
+            # Decode and load with CommandJournal.from_bytes to replay
+            "raw": base64.b64encode(journal.to_bytes()).decode(),
+            # Decode and open in Wireshark
+            "btsnoop": base64.b64encode(journal.to_btsnoop()).decode(),
+        }
+    return data
@@ -0,0 +1,111 @@
+"""Fixed size binary journal of the frames written to a BJ_LED device."""
+from __future__ import annotations
+
+import asyncio
+import struct
+from typing import Iterator, NamedTuple
+
+RESULT_OK = 0
+RESULT_ERROR = 1
+RESULT_CANCELLED = 2
+
+MAX_JOURNAL_FRAME = 16 # Longer frames are truncated, ours are 8 bytes at most
+
+# timestamp (unix seconds), latency (seconds), result, frame length, ATT handle, frame
+RECORD = struct.Struct(f"<dfBBH{MAX_JOURNAL_FRAME}s")
+
+BTSNOOP_HEADER = b"btsnoop\x00" + struct.pack(">II", 1, 1002) # Version 1, HCI UART (H4)
+BTSNOOP_RECORD = struct.Struct(">IIIIq")
+BTSNOOP_EPOCH_DELTA = 0x00dcddb30f2f8000 # Microseconds between 0 AD and the unix epoch, as Wireshark counts them
+BTSNOOP_CONN_HANDLE = 0x0040 # We don't know the real one, any fixed value keeps Wireshark happy
+ATT_WRITE_CMD_HEADER = struct.Struct("<BHHHHBH") # H4 type, ACL handle, ACL len, L2CAP len, CID, ATT opcode, ATT handle
+
+
+class JournalEntry(NamedTuple):
+    timestamp: float
+    frame: bytes
+    result: int
+    latency: float
+    handle: int
+
+
+class CommandJournal:
+    """Ring buffer of the last `size` writes, packed into one preallocated bytearray."""
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._buffer = bytearray(size * RECORD.size)
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, frame: bytes, result: int, latency: float, handle: int = 0) -> None:
+        frame = frame[:MAX_JOURNAL_FRAME]
+        RECORD.pack_into(
+            self._buffer, self._next * RECORD.size, timestamp, latency, result, len(frame), handle, bytes(frame)
+        )
+        self._next = (self._next + 1) % self._size
+        self._count = min(self._count + 1, self._size)
+
+    def entries(self) -> Iterator[JournalEntry]:
+        """Yield the recorded writes, oldest first."""
+        start = (self._next - self._count) % self._size if self._size else 0
+        for i in range(self._count):
+            offset = ((start + i) % self._size) * RECORD.size
+            timestamp, latency, result, length, handle, frame = RECORD.unpack_from(self._buffer, offset)
+            yield JournalEntry(timestamp, frame[:length], result, latency, handle)
+
+    def to_bytes(self) -> bytes:
+        """Dump the records oldest first, for saving and loading with from_bytes."""
+        return b"".join(
+            RECORD.pack(e.timestamp, e.latency, e.result, len(e.frame), e.handle, e.frame) for e in self.entries()
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> CommandJournal:
+        journal = cls(max(len(data) // RECORD.size, 1))
+        for timestamp, latency, result, length, handle, frame in RECORD.iter_unpack(data):
+            journal.append(timestamp, frame[:length], result, latency, handle)
+        return journal
+
+    def to_btsnoop(self) -> bytes:
+        """Render the journal as a btsnoop capture of ATT write commands.
+
+        Open it in Wireshark next to the captures in bt_snoops.  Failed writes are
+        included too; check entries() for the result of each one.
+        """
+        out = bytearray(BTSNOOP_HEADER)
+        for entry in self.entries():
+            l2cap_len = 3 + len(entry.frame)
+            packet = ATT_WRITE_CMD_HEADER.pack(
+                0x02, BTSNOOP_CONN_HANDLE, l2cap_len + 4, l2cap_len, 0x0004, 0x52, entry.handle
+            ) + entry.frame
+            timestamp = int(entry.timestamp * 1_000_000) + BTSNOOP_EPOCH_DELTA
+            # Flags 0: sent from the host, data rather than a command
+            out += BTSNOOP_RECORD.pack(len(packet), len(packet), 0, 0, timestamp)
+            out += packet
+        return bytes(out)
+
+
+class ReplayClient:
+    """Stands in for the Bleak client when replaying a journal, keeping what was written."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.is_connected = True
+        self.mtu_size = 23
+        self.writes: list[bytes] = []
+        self._latency = latency
+
+    async def write_gatt_char(self, char, data, response: bool = False) -> None:
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        self.writes.append(bytes(data))
+
+    async def disconnect(self) -> None:
+        self.is_connected = False
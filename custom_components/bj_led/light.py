@@ -1,7 +1,7 @@
 import logging
 import voluptuous as vol
 from typing import Any, Optional, Tuple
-from .bjled import BJLEDInstance
+from .bjled import BJLEDInstance, FLASH_LONG_DURATION, FLASH_SHORT_DURATION
 from .const import DOMAIN
 
 from homeassistant.const import CONF_MAC
@@ -11,7 +11,11 @@ from homeassistant.components.light import (
     PLATFORM_SCHEMA,
     ATTR_BRIGHTNESS,
     ATTR_RGB_COLOR,
+    ATTR_RGBW_COLOR,
     ATTR_EFFECT,
+    ATTR_FLASH,
+    ATTR_TRANSITION,
+    FLASH_LONG,
     ColorMode,
     LightEntity,
     LightEntityFeature,
@@ -35,8 +39,10 @@ class BJLEDLight(LightEntity):
     ) -> None:
         self._instance = bjledinstance
         self._entry_id = entry_id
-        self._attr_supported_color_modes = {ColorMode.RGB}
-        self._attr_supported_features = LightEntityFeature.EFFECT | LightEntityFeature.FLASH
+        self._attr_supported_color_modes = {self._instance.color_mode}
+        self._attr_supported_features = LightEntityFeature.FLASH | LightEntityFeature.TRANSITION
+        if self._instance.effect_list:
+            self._attr_supported_features |= LightEntityFeature.EFFECT
         self._attr_brightness_step_pct = 10
         self._attr_name = name
         self._attr_unique_id = self._instance.mac
@@ -52,7 +58,15 @@ class BJLEDLight(LightEntity):
     
     @property
     def rgb_color(self):
-        return self._instance.rgb_color
+        color = self._instance.rgb_color
+        return color[:3] if color else None
+
+    @property
+    def rgbw_color(self):
+        color = self._instance.rgb_color
+        if not color or not self._instance.model.rgbw:
+            return None
+        return (tuple(color) + (0,))[:4]
     
     @property
     def is_on(self) -> Optional[bool]:
@@ -96,19 +110,41 @@ class BJLEDLight(LightEntity):
     def should_poll(self):
         return False
 
+    def _requested_color(self, kwargs: dict[str, Any]):
+        return kwargs.get(ATTR_RGBW_COLOR) or kwargs.get(ATTR_RGB_COLOR)
+
     async def async_turn_on(self, **kwargs: Any) -> None:
-        if not self.is_on:
+        requested = self._requested_color(kwargs)
+        if ATTR_FLASH in kwargs:
+            rgb = requested or self._instance.rgb_color or (255, 255, 255)
+            bri = kwargs.get(ATTR_BRIGHTNESS, self.brightness)
+            duration = FLASH_LONG_DURATION if kwargs[ATTR_FLASH] == FLASH_LONG else FLASH_SHORT_DURATION
+            await self._instance.flash(rgb, bri, duration)
+            return
+
+        if kwargs.get(ATTR_TRANSITION) and ATTR_EFFECT not in kwargs:
+            rgb = requested or self._instance.rgb_color or (255, 255, 255)
+            bri = kwargs.get(ATTR_BRIGHTNESS, self.brightness)
+            if not self.is_on or rgb != self._instance.rgb_color or bri != self.brightness:
+                await self._instance.transition_to(rgb, bri, kwargs[ATTR_TRANSITION])
+                self.async_write_ha_state()
+                return
+
+        if not self.is_on or self._instance.needs_refresh:
+            # Also cancels a running fade or flash and puts our state back
             await self._instance.turn_on()
                 
-        if ATTR_BRIGHTNESS in kwargs and kwargs[ATTR_BRIGHTNESS] != self.brightness:
+        brightness_changed = ATTR_BRIGHTNESS in kwargs and kwargs[ATTR_BRIGHTNESS] != self.brightness
+        # A colour is sent at the requested brightness, so only send brightness on its own
+        if brightness_changed and requested is None:
             self._brightness = kwargs[ATTR_BRIGHTNESS]
             await self._instance.set_brightness_local(kwargs[ATTR_BRIGHTNESS])# FIXME
                
-        if ATTR_RGB_COLOR in kwargs:
-            if kwargs[ATTR_RGB_COLOR] != self.rgb_color:
+        if requested is not None:
+            if requested != self._instance.rgb_color or brightness_changed:
                 self._effect = None
                 bri = kwargs[ATTR_BRIGHTNESS] if ATTR_BRIGHTNESS in kwargs else None
-                await self._instance.set_rgb_color(kwargs[ATTR_RGB_COLOR], bri)
+                await self._instance.set_rgb_color(requested, bri)
         
         if ATTR_EFFECT in kwargs:
             if kwargs[ATTR_EFFECT] != self.effect:
@@ -117,7 +153,10 @@ class BJLEDLight(LightEntity):
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        await self._instance.turn_off()
+        if kwargs.get(ATTR_TRANSITION):
+            await self._instance.fade_off(kwargs[ATTR_TRANSITION])
+        else:
+            await self._instance.turn_off()
         self.async_write_ha_state()
 
     async def async_set_effect(self, effect: str) -> None:
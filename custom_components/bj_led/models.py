@@ -0,0 +1,99 @@
+"""Registry of the BJ_LED controller variants we know how to talk to."""
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass, field
+
+DEFAULT_WRITE_UUID = "0000ee01-0000-1000-8000-00805f9b34fb"
+
+
+@dataclass(frozen=True)
+class BJLEDModel:
+    """Frames, characteristics and capabilities of one controller variant.
+
+    The colour and effect frames are packed with structs built once per model,
+    so encoding a frame is a single pack call.
+    """
+
+    name: str # Advertised name prefix, matched case insensitively
+    turn_on: bytes
+    turn_off: bytes
+    write_uuids: tuple[str, ...] = (DEFAULT_WRITE_UUID,)
+    rgbw: bool = False # Colour frames carry a fourth, white, byte
+    effect_banks: tuple[int, ...] = (0x03,) # First byte of the EFFECT_MAP ids this model runs
+    color_header: bytes = bytes.fromhex("69 96 05 02")
+    effect_header: bytes = bytes.fromhex("69 96 03")
+    _color_codec: struct.Struct = field(init=False, repr=False, compare=False)
+    _effect_codec: struct.Struct = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        channels = 4 if self.rgbw else 3
+        object.__setattr__(self, "_color_codec", struct.Struct(f"{len(self.color_header)}s{channels}B"))
+        object.__setattr__(self, "_effect_codec", struct.Struct(f"{len(self.effect_header)}s3B"))
+
+    @property
+    def max_frame_size(self) -> int:
+        return max(len(self.turn_on), len(self.turn_off), self._color_codec.size, self._effect_codec.size)
+
+    def color_frame(self, color: tuple[int, ...]) -> bytearray:
+        """Encode an (r, g, b) or (r, g, b, w) colour, padding or dropping white to suit the model."""
+        if self.rgbw:
+            return bytearray(self._color_codec.pack(self.color_header, *color[:3], color[3] if len(color) > 3 else 0))
+        return bytearray(self._color_codec.pack(self.color_header, *color[:3]))
+
+    def effect_frame(self, effect_id: tuple[int, int], speed: int) -> bytearray:
+        return bytearray(self._effect_codec.pack(self.effect_header, effect_id[0], effect_id[1], speed))
+
+
+class _PrefixTrie:
+    """Longest prefix lookup of advertised names, one dict level per character."""
+
+    _VALUE = "" # Never a single character, so can't clash with a child key
+
+    def __init__(self) -> None:
+        self._root: dict = {}
+
+    def insert(self, prefix: str, value: BJLEDModel) -> None:
+        node = self._root
+        for char in prefix.lower():
+            node = node.setdefault(char, {})
+        node[self._VALUE] = value
+
+    def longest_prefix(self, name: str) -> BJLEDModel | None:
+        node = self._root
+        found = node.get(self._VALUE)
+        for char in name.lower():
+            node = node.get(char)
+            if node is None:
+                break
+            found = node.get(self._VALUE, found)
+        return found
+
+
+BJ_LED = BJLEDModel(
+    name="BJ_LED",
+    turn_on=bytes.fromhex("69 96 02 01 01"),
+    turn_off=bytes.fromhex("69 96 02 01 00"),
+)
+
+# Only add variants whose advertised name and frames come from a real device
+# and a capture in bt_snoops, not from guesses.
+
+DEFAULT_MODEL = BJ_LED
+
+_MODELS = _PrefixTrie()
+
+
+def register_model(model: BJLEDModel) -> None:
+    """Add a model, replacing any registered under the same name prefix."""
+    _MODELS.insert(model.name, model)
+
+
+def lookup_model(name: str | None) -> BJLEDModel | None:
+    """Return the model with the longest name prefix matching name, if any."""
+    if not name:
+        return None
+    return _MODELS.longest_prefix(name)
+
+
+register_model(BJ_LED)
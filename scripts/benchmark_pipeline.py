@@ -0,0 +1,83 @@
+"""Benchmark how many frames per second the write paths can push.
+
+Compares writing one frame per command, as set_rgb_color does, with the
+pipelined path at depth 1 (serial fallback) and at PIPELINE_DEPTH, against a
+fake client that takes a fixed time per write.  A write-without-response on a
+real link costs roughly one connection interval, so the latencies default to
+common intervals.  The fake client's writes overlap perfectly, so the results
+are a synthetic upper bound: depth N is N times depth 1 by construction, and a
+real link won't get there.  Needs Home Assistant installed:
+
+    python scripts/benchmark_pipeline.py --frames 200 --latency 7.5 15 30 50
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO))
+
+from custom_components.bj_led import bjled
+from custom_components.bj_led.bjled import PIPELINE_DEPTH, BJLEDInstance
+from custom_components.bj_led.journal import ReplayClient
+
+ADDRESS = "FF:FF:00:00:00:01"
+
+
+def _make_instance(latency: float) -> BJLEDInstance:
+    device = SimpleNamespace(address=ADDRESS, name="BJ_LED", rssi=-60, details={})
+    with patch.object(bjled.bluetooth, "async_ble_device_from_address", lambda hass, address, **kwargs: device):
+        instance = BJLEDInstance(ADDRESS, False, 0, None)
+    instance._client = ReplayClient(latency)
+    instance._write_uuid = instance.model.write_uuids[0]
+    return instance
+
+
+def _frames(count: int) -> list[bytearray]:
+    return [bytearray.fromhex("69 96 05 02") + bytes((i % 256, 0, 255 - i % 256)) for i in range(count)]
+
+
+async def _per_command(instance: BJLEDInstance, frames: list[bytearray]) -> None:
+    for frame in frames:
+        await instance._write(frame)
+
+
+async def _pipelined(instance: BJLEDInstance, frames: list[bytearray], depth: int) -> None:
+    instance._pipeline_depth = depth
+    await instance._write_pipelined(frames)
+
+
+async def _measure(latency: float, count: int) -> list[float]:
+    frames = _frames(count)
+    loop = asyncio.get_running_loop()
+    results = []
+    for run in (
+        lambda instance: _per_command(instance, frames),
+        lambda instance: _pipelined(instance, frames, 1),
+        lambda instance: _pipelined(instance, frames, PIPELINE_DEPTH),
+    ):
+        instance = _make_instance(latency)
+        start = loop.time()
+        await run(instance)
+        results.append(count / (loop.time() - start))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--latency", type=float, nargs="+", default=[7.5, 15, 30, 50], help="Milliseconds per write")
+    args = parser.parse_args()
+    print(f"{'latency ms':>10} {'per command':>12} {'depth 1':>9} {f'depth {PIPELINE_DEPTH}':>9}  frames/s")
+    for latency in args.latency:
+        per_command, serial, pipelined = asyncio.run(_measure(latency / 1000, args.frames))
+        print(f"{latency:>10} {per_command:>12.1f} {serial:>9.1f} {pipelined:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+"""Load test the BJ_LED integration against simulated strips.
+
+Starts a Home Assistant test instance with N BJ_LED config entries backed by
+fake BLE devices, drives light.turn_on traffic shaped like real automations
+and reports throughput, tail latency, event loop lag and memory per device.
+
+The fake devices take a while to connect, take a while per write and share a
+few adapters with a limited number of connection slots, like a real install
+with a USB dongle and a couple of ESPHome proxies.
+
+Calls with a transition return as soon as the fade is queued, so their
+latency is reported separately (fade_*).  Memory is KiB per device, traced with
+tracemalloc: after setup, peak while the traffic runs and still held after it.
+
+Needs Home Assistant and pytest-homeassistant-custom-component installed:
+
+    python scripts/load_test.py --devices 10 50 100 200 --duration 60
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import random
+import sys
+import tempfile
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO))
+
+from bleak.exc import BleakError
+from homeassistant.const import CONF_MAC
+from homeassistant.helpers import entity_registry as er
+from homeassistant.loader import DATA_CUSTOM_COMPONENTS
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_test_home_assistant
+
+from custom_components.bj_led.const import CONF_DELAY, DOMAIN
+
+WRITE_UUID = "0000ee01-0000-1000-8000-00805f9b34fb"
+LAG_SAMPLE_INTERVAL = 0.05
+
+
+class FakeCharacteristic:
+    """Just enough of a Bleak characteristic for the integration to pipeline writes."""
+
+    def __init__(self, uuid: str) -> None:
+        self.uuid = uuid
+        self.handle = 0x0010
+        self.properties = ["write-without-response", "write"]
+        self.max_write_without_response_size = 244
+
+
+class FakeServices:
+    def __init__(self) -> None:
+        self._char = FakeCharacteristic(WRITE_UUID)
+
+    def get_characteristic(self, uuid: str) -> FakeCharacteristic | None:
+        return self._char if uuid == WRITE_UUID else None
+
+
+class FakeAdapter:
+    """A Bluetooth adapter or proxy with a fixed number of connection slots."""
+
+    def __init__(self, name: str, slots: int, slot_timeout: float) -> None:
+        self.name = name
+        self.slots = asyncio.Semaphore(slots)
+        self.slot_timeout = slot_timeout
+
+
+@dataclass
+class Stats:
+    latencies: list[float] = field(default_factory=list)
+    fade_latencies: list[float] = field(default_factory=list) # Return once the fade is queued, so kept apart
+    failures: int = 0
+    errors: Counter = field(default_factory=Counter)
+    frames: int = 0
+    connects: int = 0
+    slot_waits: int = 0
+    lag: list[float] = field(default_factory=list)
+
+
+class FakeClient:
+    def __init__(self, adapter: FakeAdapter, args: argparse.Namespace, stats: Stats, disconnected_callback) -> None:
+        self.is_connected = True
+        self.mtu_size = 247
+        self.services = FakeServices()
+        self._adapter = adapter
+        self._args = args
+        self._stats = stats
+        self._disconnected_callback = disconnected_callback
+
+    async def write_gatt_char(self, char, data, response: bool = False) -> None:
+        if not self.is_connected:
+            raise BleakError("Not connected")
+        await asyncio.sleep(_jitter(self._args.write_latency))
+        self._stats.frames += 1
+
+    async def disconnect(self) -> None:
+        if not self.is_connected:
+            return
+        self.is_connected = False
+        self._adapter.slots.release()
+        self._disconnected_callback(self)
+
+
+def _jitter(mean: float) -> float:
+    """Spread a latency around its mean with an occasional slow outlier, like a busy radio."""
+    latency = mean * random.uniform(0.5, 1.5)
+    if random.random() < 0.01:
+        latency *= 10
+    return latency
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * pct / 100), len(ordered) - 1)]
+
+
+async def _sample_loop_lag(stats: Stats) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(LAG_SAMPLE_INTERVAL)
+        stats.lag.append(loop.time() - start - LAG_SAMPLE_INTERVAL)
+
+
+async def _call(hass, stats: Stats, service: str, data: dict) -> None:
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    try:
+        await hass.services.async_call("light", service, data, blocking=True)
+    except Exception as err:  # noqa: BLE001 - anything the integration raises counts as a failed call
+        stats.failures += 1
+        stats.errors[f"{type(err).__name__}: {err}"] += 1
+        return
+    latencies = stats.fade_latencies if "transition" in data else stats.latencies
+    latencies.append(loop.time() - start)
+
+
+def _random_turn_on(entity_ids: list[str] | str) -> dict:
+    data = {
+        "entity_id": entity_ids,
+        "rgb_color": [random.randint(0, 255) for _ in range(3)],
+        "brightness": random.randint(1, 255),
+    }
+    if random.random() < 0.2:
+        data["transition"] = 1
+    return data
+
+
+async def _device_traffic(hass, stats: Stats, entity_id: str, args: argparse.Namespace, end: float) -> None:
+    """Motion sensors and the like: independent calls at a Poisson rate per device."""
+    if args.rate <= 0:
+        return
+    loop = asyncio.get_running_loop()
+    rate = args.rate / 60
+    while (delay := random.expovariate(rate)) < end - loop.time():
+        await asyncio.sleep(delay)
+        if random.random() < 0.05:
+            await _call(hass, stats, "turn_off", {"entity_id": entity_id})
+        else:
+            await _call(hass, stats, "turn_on", _random_turn_on(entity_id))
+
+
+async def _scene_traffic(hass, stats: Stats, entity_ids: list[str], args: argparse.Namespace, end: float) -> None:
+    """Scenes and groups: one call switching a large share of the strips at once."""
+    if not entity_ids:
+        return
+    loop = asyncio.get_running_loop()
+    while loop.time() + args.scene_interval < end:
+        await asyncio.sleep(args.scene_interval)
+        chosen = random.sample(entity_ids, max(1, int(len(entity_ids) * args.scene_share)))
+        await _call(hass, stats, "turn_on", _random_turn_on(chosen))
+
+
+@contextlib.asynccontextmanager
+async def _config_dir():
+    """A throwaway config dir that sees this checkout's integration, so HA's storage stays out of the repo."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        (Path(config_dir) / "custom_components").symlink_to(REPO / "custom_components")
+        yield config_dir
+
+
+async def run_once(devices: int, args: argparse.Namespace) -> dict:
+    stats = Stats()
+    adapters = [FakeAdapter(f"hci{i}", args.slots, args.slot_timeout) for i in range(args.adapters)]
+    device_adapter: dict[str, FakeAdapter] = {}
+
+    def ble_device_from_address(hass, address, connectable=True):
+        return SimpleNamespace(address=address, name="BJ_LED", rssi=-60, details={})
+
+    async def establish_connection(client_class, device, name, disconnected_callback, **kwargs):
+        adapter = device_adapter[device.address]
+        if adapter.slots.locked():
+            stats.slot_waits += 1
+        try:
+            await asyncio.wait_for(adapter.slots.acquire(), adapter.slot_timeout)
+        except asyncio.TimeoutError as err:
+            raise BleakError(f"{adapter.name}: No free connection slots") from err
+        await asyncio.sleep(_jitter(args.connect_latency))
+        stats.connects += 1
+        return FakeClient(adapter, args, stats, disconnected_callback)
+
+    async with _config_dir() as config_dir, async_test_home_assistant() as hass:
+        # Load our integration from this checkout and pretend bluetooth is already up
+        hass.config.config_dir = config_dir
+        hass.data.pop(DATA_CUSTOM_COMPONENTS, None)
+        hass.config.components.add("bluetooth")
+
+        with (
+            patch("homeassistant.components.bluetooth.async_ble_device_from_address", ble_device_from_address),
+            patch("custom_components.bj_led.bjled.establish_connection", establish_connection),
+            patch("custom_components.bj_led.bjled.BleakGATTCharacteristic", FakeCharacteristic),
+        ):
+            if args.memory:
+                tracemalloc.start()
+            baseline, _ = tracemalloc.get_traced_memory()
+            for i in range(devices):
+                mac = f"FF:FF:00:00:{i >> 8:02X}:{i & 0xFF:02X}"
+                device_adapter[mac] = adapters[i % len(adapters)]
+                MockConfigEntry(
+                    domain=DOMAIN,
+                    unique_id=mac,
+                    data={CONF_MAC: mac, "name": f"Strip {i}"},
+                    options={CONF_DELAY: args.delay},
+                ).add_to_hass(hass)
+            await async_setup_component(hass, DOMAIN, {})
+            await hass.async_block_till_done()
+            entity_ids = [
+                entry.entity_id
+                for entry in er.async_get(hass).entities.values()
+                if entry.platform == DOMAIN
+            ]
+            setup, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+
+            loop = asyncio.get_running_loop()
+            lag_task = loop.create_task(_sample_loop_lag(stats))
+            start = loop.time()
+            end = start + args.duration
+            await asyncio.gather(
+                _scene_traffic(hass, stats, entity_ids, args, end),
+                *(_device_traffic(hass, stats, entity_id, args, end) for entity_id in entity_ids),
+            )
+            elapsed = loop.time() - start
+            lag_task.cancel()
+            await hass.async_block_till_done()
+            # Under traffic: the peak while calls were running and what is still held after
+            after, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    calls = len(stats.latencies) + len(stats.fade_latencies)
+    per_device = 1024 * max(devices, 1)
+    return {
+        "devices": devices,
+        "entities": len(entity_ids),
+        "calls": calls,
+        "fades": len(stats.fade_latencies),
+        "failures": stats.failures,
+        "calls_per_s": calls / elapsed,
+        "frames_per_s": stats.frames / elapsed,
+        "p50_ms": _percentile(stats.latencies, 50) * 1000,
+        "p95_ms": _percentile(stats.latencies, 95) * 1000,
+        "p99_ms": _percentile(stats.latencies, 99) * 1000,
+        "max_ms": max(stats.latencies, default=0) * 1000,
+        "fade_p50_ms": _percentile(stats.fade_latencies, 50) * 1000,
+        "fade_p99_ms": _percentile(stats.fade_latencies, 99) * 1000,
+        "lag_p99_ms": _percentile(stats.lag, 99) * 1000,
+        "lag_max_ms": max(stats.lag, default=0) * 1000,
+        "connects": stats.connects,
+        "slot_waits": stats.slot_waits,
+        "setup_kib": (setup - baseline) / per_device,
+        "peak_kib": (peak - baseline) / per_device,
+        "after_kib": (after - baseline) / per_device,
+        "errors": stats.errors,
+    }
+
+
+COLUMNS = (
+    ("devices", "{:>7}"),
+    ("calls", "{:>7}"),
+    ("fades", "{:>6}"),
+    ("failures", "{:>8}"),
+    ("calls_per_s", "{:>11.1f}"),
+    ("frames_per_s", "{:>12.1f}"),
+    ("p50_ms", "{:>8.1f}"),
+    ("p95_ms", "{:>8.1f}"),
+    ("p99_ms", "{:>8.1f}"),
+    ("max_ms", "{:>8.1f}"),
+    ("fade_p50_ms", "{:>11.1f}"),
+    ("fade_p99_ms", "{:>11.1f}"),
+    ("lag_p99_ms", "{:>10.1f}"),
+    ("lag_max_ms", "{:>10.1f}"),
+    ("connects", "{:>8}"),
+    ("slot_waits", "{:>10}"),
+    ("setup_kib", "{:>9.1f}"),
+    ("peak_kib", "{:>8.1f}"),
+    ("after_kib", "{:>9.1f}"),
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, nargs="+", default=[10, 50, 100], help="Strip counts to test, one run each")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds of traffic per run")
+    parser.add_argument("--adapters", type=int, default=3, help="Adapters and proxies the strips are spread over")
+    parser.add_argument("--slots", type=int, default=3, help="Connection slots per adapter")
+    parser.add_argument("--slot-timeout", type=float, default=10, help="Seconds to wait for a free slot before failing")
+    parser.add_argument("--connect-latency", type=float, default=1.5, help="Mean seconds to connect")
+    parser.add_argument("--write-latency", type=float, default=0.03, help="Mean seconds per write")
+    parser.add_argument("--delay", type=int, default=120, help="Integration disconnect delay option")
+    parser.add_argument("--rate", type=float, default=2, help="Individual calls per device per minute")
+    parser.add_argument("--scene-interval", type=float, default=10, help="Seconds between scene calls")
+    parser.add_argument("--scene-share", type=float, default=0.5, help="Share of strips each scene switches")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--no-memory", dest="memory", action="store_false", help="Skip tracemalloc, which slows everything down"
+    )
+    args = parser.parse_args()
+
+    print(" ".join(fmt.replace(".1f", "").format(name) for name, fmt in COLUMNS))
+    for devices in args.devices:
+        random.seed(args.seed)
+        result = asyncio.run(run_once(devices, args))
+        print(" ".join(fmt.format(result[name]) for name, fmt in COLUMNS), flush=True)
+        for error, count in result["errors"].most_common(3):
+            print(f"    {count} x {error}")
+
+
+if __name__ == "__main__":
+    main()
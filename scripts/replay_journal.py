@@ -0,0 +1,109 @@
+"""Replay a BJ_LED command journal from a diagnostics download.
+
+Decodes the journal's "raw" dump, loads it with CommandJournal.from_bytes and
+pushes every frame back through the write path of a throwaway BJLEDInstance
+talking to a fake client, with the original spacing between frames.  Then it
+checks the fake client saw exactly the journaled frames:
+
+    python scripts/replay_journal.py config_entry-bj_led-xxxx.json --speed 10 --btsnoop incident.log
+
+With --self-test it first makes its own diagnostics download from an instance
+with the journal enabled, so the whole round trip can be checked without a
+strip.  Needs Home Assistant installed.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO))
+
+from custom_components.bj_led import bjled
+from custom_components.bj_led.bjled import BJLEDInstance
+from custom_components.bj_led.const import DOMAIN
+from custom_components.bj_led.diagnostics import async_get_config_entry_diagnostics
+from custom_components.bj_led.journal import CommandJournal, ReplayClient
+
+ADDRESS = "FF:FF:00:00:00:01"
+
+
+def _make_instance(name: str, journal_size: int = 0) -> BJLEDInstance:
+    """Build an instance without a real Bluetooth stack behind it."""
+    device = SimpleNamespace(address=ADDRESS, name=name, rssi=-60, details={})
+    with patch.object(bjled.bluetooth, "async_ble_device_from_address", lambda hass, address, **kwargs: device):
+        return BJLEDInstance(ADDRESS, False, 0, None, journal_size)
+
+
+async def _self_test_diagnostics() -> dict:
+    """Drive an instance with the journal on and return its diagnostics, as downloaded."""
+    instance = _make_instance("BJ_LED", journal_size=64)
+    client = ReplayClient(latency=0.005)
+    instance._client = client
+    instance._write_uuid = instance.model.write_uuids[0]
+    await instance.turn_on()
+    await instance.set_rgb_color((255, 64, 0), 200)
+    await instance.set_effect("Rainbow fade")
+    await instance.set_rgb_color((0, 0, 255), 255)
+    await instance.turn_off()
+    hass = SimpleNamespace(data={DOMAIN: {"self_test": instance}})
+    diagnostics = await async_get_config_entry_diagnostics(hass, SimpleNamespace(entry_id="self_test"))
+    # Through JSON and back, like a file saved from the UI
+    return json.loads(json.dumps(diagnostics))
+
+
+async def replay(diagnostics: dict, speed: float, btsnoop: Path | None) -> bool:
+    journal = CommandJournal.from_bytes(base64.b64decode(diagnostics["journal"]["raw"]))
+    expected = [record.frame for record in journal.entries()]
+    print(f"Loaded {len(journal)} journaled writes for {diagnostics['name']}")
+    if btsnoop is not None:
+        btsnoop.write_bytes(journal.to_btsnoop())
+        print(f"Wrote {btsnoop}")
+
+    # Its own instance, so nothing live ever ends up talking to the fake client
+    instance = _make_instance(diagnostics["name"])
+    client = ReplayClient()
+    instance._client = client
+    instance._write_uuid = instance.model.write_uuids[0]
+    previous = None
+    for record in journal.entries():
+        if previous is not None and speed:
+            await asyncio.sleep(max(record.timestamp - previous, 0) / speed)
+        previous = record.timestamp
+        await instance._write_while_connected(bytearray(record.frame))
+    for record, frame in zip(journal.entries(), client.writes):
+        print(f"{record.timestamp:17.6f} {record.latency * 1000:7.1f} ms result {record.result}  {frame.hex(' ')}")
+
+    ok = client.writes == expected
+    if not ok:
+        print("Replayed frames differ from the journal")
+    print("Round trip OK" if ok else "Round trip FAILED")
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("diagnostics", nargs="?", type=Path, help="Diagnostics JSON downloaded from Home Assistant")
+    parser.add_argument("--self-test", action="store_true", help="Make a diagnostics download to replay first")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay faster than real time, 0 for no gaps")
+    parser.add_argument("--btsnoop", type=Path, help="Also write the journal out as a btsnoop capture")
+    args = parser.parse_args()
+    if args.self_test:
+        diagnostics = asyncio.run(_self_test_diagnostics())
+    elif args.diagnostics is not None:
+        diagnostics = json.loads(args.diagnostics.read_text())
+        # Downloads from the UI wrap the integration's data
+        diagnostics = diagnostics.get("data", diagnostics)
+    else:
+        parser.error("give a diagnostics file or --self-test")
+    sys.exit(0 if asyncio.run(replay(diagnostics, args.speed, args.btsnoop)) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Tests for the pipelined write path and the background fade and flash streams."""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from bleak.exc import BleakError
+
+from custom_components.bj_led import bjled
+from custom_components.bj_led.bjled import PIPELINE_DEPTH, BJLEDInstance
+
+ADDRESS = "FF:FF:00:00:00:01"
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+
+
+class FlakyClient:
+    """A connected client where every write takes latency, and fails while failing is set."""
+
+    def __init__(self, latency: float) -> None:
+        self.is_connected = True
+        self.mtu_size = 23
+        self.failing = False
+        self.writes: list[bytes] = []
+        self.failures = 0
+        self._latency = latency
+
+    async def write_gatt_char(self, char, data, response: bool = False) -> None:
+        await asyncio.sleep(self._latency)
+        if self.failing:
+            self.failures += 1
+            raise BleakError(f"boom {self.failures}")
+        self.writes.append(bytes(data))
+
+    async def disconnect(self) -> None:
+        self.is_connected = False
+
+
+def _make_instance(client) -> BJLEDInstance:
+    device = SimpleNamespace(address=ADDRESS, name="BJ_LED", rssi=-60, details={})
+    with patch.object(bjled.bluetooth, "async_ble_device_from_address", lambda hass, address, **kwargs: device):
+        instance = BJLEDInstance(ADDRESS, False, 0, None)
+    instance._client = client
+    instance._write_uuid = instance.model.write_uuids[0]
+    instance._pipeline_depth = PIPELINE_DEPTH
+    return instance
+
+
+@pytest.mark.asyncio
+async def test_failed_fade_does_not_abort_the_next_one():
+    client = FlakyClient(latency=0.1)
+    instance = _make_instance(client)
+    await instance.transition_to(RED, 255, 1.0)
+    client.failing = True
+    await instance._stream_task
+    assert instance.needs_refresh
+    # Frames still in flight when the fade gave up fail too, then the link recovers
+    await asyncio.sleep(0.2)
+    assert client.failures > 1
+    client.failing = False
+    await instance.transition_to(GREEN, 255, 0.3)
+    await instance._stream_task
+    assert client.writes[-1] == bytes(instance.model.color_frame(GREEN))
+    assert not instance.needs_refresh
+
+
+@pytest.mark.asyncio
+async def test_failed_flash_does_not_abort_the_next_fade():
+    client = FlakyClient(latency=0.6)
+    instance = _make_instance(client)
+    await instance.turn_on()
+    await instance.set_rgb_color(GREEN, 255)
+    # Purple has no hardware strobe, so the flash is timed from here
+    await instance.flash((128, 0, 255), 255, 1.0)
+    client.failing = True
+    await instance._stream_task
+    await asyncio.sleep(0.6)
+    assert client.failures > 1
+    client.failing = False
+    await instance.transition_to(RED, 255, 0.3)
+    await instance._stream_task
+    assert client.writes[-1] == bytes(instance.model.color_frame(RED))
+
+
+@pytest.mark.asyncio
+async def test_flash_with_unknown_colour_leaves_strip_for_turn_on():
+    client = FlakyClient(latency=0.01)
+    instance = _make_instance(client)
+    await instance.turn_on()
+    await instance.flash(RED, 255, 0.2)
+    await instance._stream_task
+    # The flash colour must not be left on as if it were the light's own
+    assert instance.rgb_color is None
+    assert instance.needs_refresh
+
+
+@pytest.mark.asyncio
+async def test_fade_from_effect_does_not_drop_to_black():
+    client = FlakyClient(latency=0.01)
+    instance = _make_instance(client)
+    await instance.turn_on()
+    await instance.set_rgb_color(RED, 255)
+    await instance.set_effect("Rainbow fade")
+    sent = len(client.writes)
+    await instance.transition_to(GREEN, 255, 0.3)
+    await instance._stream_task
+    fade = client.writes[sent:]
+    # Starts from the red the effect replaced and never passes through black
+    assert fade[0].startswith(instance.model.color_header) and fade[0][-3] > 200
+    assert bytes(instance.model.color_frame((0, 0, 0))) not in fade